@@ -0,0 +1,14 @@
+"""
+Gunicorn configuration for running the Orders API
+"""
+
+import os
+
+# 2n+1 workers; uvicorn[standard] ships uvloop and httptools, which the
+# uvicorn worker picks up automatically for the event loop and HTTP parsing
+workers = 2 * (os.cpu_count() or 1) + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = "0.0.0.0:8000"
+
+# Keep DB_POOL_SIZE + DB_MAX_OVERFLOW times the worker count below the
+# database's max connections when raising either side
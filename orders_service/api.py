@@ -4,21 +4,37 @@ Module that provides the route endpoints for the Orders API
 
 from uuid import UUID
 
+import msgspec
 from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 
-from orders_service.exceptions import OrderEntityNotFoundError
 from orders_service.repository import OrdersRepoDep
 from orders_service.schemas import (
     OrderCreateSchema,
-    OrderGetSchema,
-    OrdersListSchema,
+    OrdersListStruct,
     OrderUpdateSchema,
+    order_to_struct,
 )
 
-router = APIRouter(prefix="/orders")
+router = APIRouter(prefix="/orders", default_response_class=ORJSONResponse)
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=OrdersListSchema)
+def _struct_response(struct, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encodes a msgspec struct as a JSON response"""
+
+    return Response(content=msgspec.json.encode(struct), status_code=status_code, media_type="application/json")
+
+
+def _not_found(order_id: UUID) -> HTTPException:
+    """Returns the 404 for a missing order"""
+
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Order with ID {order_id} not found")
+
+
+@router.get("/", status_code=status.HTTP_200_OK)
+@cache(expire=30, namespace="orders")
 async def list_orders(
     repo: OrdersRepoDep,
     cancelled: bool | None = None,
@@ -26,12 +42,12 @@ async def list_orders(
 ):
     """Returns a list of orders"""
 
-    orders = await repo.list(cancelled, limit)
+    orders = await repo.list_rows(cancelled, limit)
 
-    return orders.model_dump()
+    return _struct_response(OrdersListStruct(orders=[order_to_struct(order) for order in orders]))
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED, response_model=OrderGetSchema)
+@router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_order(
     repo: OrdersRepoDep,
     order_details: OrderCreateSchema,
@@ -40,20 +56,25 @@ async def create_order(
 
     order = await repo.create(order_details)
 
-    return order.dict()
+    await FastAPICache.clear(namespace="orders")
+
+    return _struct_response(order_to_struct(order), status.HTTP_201_CREATED)
 
 
-@router.get("/{order_id}", status_code=status.HTTP_200_OK, response_model=OrderGetSchema)
+@router.get("/{order_id}", status_code=status.HTTP_200_OK)
+@cache(expire=30, namespace="orders")
 async def get_order(repo: OrdersRepoDep, order_id: UUID):
     """Returns the details of a specified order"""
 
-    try:
-        return await repo.get(order_id)
-    except OrderEntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    order = await repo.get(order_id)
+
+    if order is None:
+        raise _not_found(order_id)
+
+    return _struct_response(order_to_struct(order))
 
 
-@router.put("/{order_id}", response_model=OrderGetSchema)
+@router.put("/{order_id}")
 async def update_order(
     repo: OrdersRepoDep,
     order_id: UUID,
@@ -61,12 +82,14 @@ async def update_order(
 ):
     """Replaces an existing specified order"""
 
-    try:
-        order = await repo.update(order_id, order_details)
+    order = await repo.update(order_id, order_details)
 
-        return order.dict()
-    except OrderEntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    if order is None:
+        raise _not_found(order_id)
+
+    await FastAPICache.clear(namespace="orders")
+
+    return _struct_response(order_to_struct(order))
 
 
 @router.delete("/{order_id}", response_class=Response)
@@ -76,39 +99,45 @@ async def delete_order(
 ):
     """Deletes an existing specified order"""
 
-    try:
-        await repo.delete(order_id)
+    order = await repo.delete(order_id)
+
+    if order is None:
+        raise _not_found(order_id)
+
+    await FastAPICache.clear(namespace="orders")
 
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-    except OrderEntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.post("/{order_id}/cancel", response_model=OrderGetSchema)
+@router.post("/{order_id}/cancel")
 async def cancel_order(
     repo: OrdersRepoDep,
     order_id: UUID,
 ):
     """Cancels a specified order"""
 
-    try:
-        order = await repo.cancel(order_id)
+    order = await repo.cancel(order_id)
 
-        return order.dict()
-    except OrderEntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    if order is None:
+        raise _not_found(order_id)
 
+    await FastAPICache.clear(namespace="orders")
 
-@router.post("/{order_id}/pay", response_model=OrderGetSchema)
+    return _struct_response(order_to_struct(order))
+
+
+@router.post("/{order_id}/pay")
 async def pay_order(
     repo: OrdersRepoDep,
     order_id: UUID,
 ):
     """Processes payment for a specified order"""
 
-    try:
-        order = await repo.pay(order_id)
+    order = await repo.pay(order_id)
+
+    if order is None:
+        raise _not_found(order_id)
+
+    await FastAPICache.clear(namespace="orders")
 
-        return order.dict()
-    except OrderEntityNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message) from e
+    return _struct_response(order_to_struct(order))
@@ -4,9 +4,13 @@ Module that provides entry point for the Orders API
 
 from pathlib import Path
 
-import yaml
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Response, status
 from fastapi.concurrency import asynccontextmanager
+from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import PickleCoder
 
 from orders_service.api import router
 from orders_service.config import get_config
@@ -19,25 +23,75 @@ async def lifespan(_: FastAPI):
 
     await begin_session_create_tables()
     yield
-    await end_session()
+    await end_session(force=True)
 
 
-init_session_manager(get_config("orders_service/.env").DATABASE_URL)
+def request_key_builder(func, namespace, *, request, response, args, kwargs):  # pylint: disable=unused-argument
+    """Builds cache keys from the request path and query string"""
+
+    return f"{FastAPICache.get_prefix()}:{namespace}:{request.url.path}?{request.url.query}"
+
+
+def cache_backend(redis_url: str | None):
+    """Returns the Redis cache backend when configured, in-memory otherwise"""
+
+    if redis_url:
+        from fastapi_cache.backends.redis import RedisBackend  # pylint: disable=import-outside-toplevel
+        from redis import asyncio as aioredis  # pylint: disable=import-outside-toplevel
+
+        return RedisBackend(aioredis.from_url(redis_url))
+
+    return InMemoryBackend()
+
+
+config = get_config("orders_service/.env")
+
+FastAPICache.init(
+    cache_backend(config.REDIS_URL), prefix="orders-cache", coder=PickleCoder, key_builder=request_key_builder
+)
+
+init_session_manager(
+    config.DATABASE_URL,
+    config.DEBUG,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_recycle=config.DB_POOL_RECYCLE,
+)
 
 app = FastAPI(
-    title="Orders API", lifespan=lifespan, debug=True, openapi_url="/openapi/orders.json", docs_url="/docs/orders"
+    title="Orders API",
+    lifespan=lifespan,
+    debug=True,
+    openapi_url=None,
+    docs_url=None,
+    default_response_class=ORJSONResponse,
 )
 
 
+HEALTH_OK = Response(content=b'"Server is running!"', media_type="application/json")
+
+
 @app.get("/health", status_code=status.HTTP_200_OK)
-def health_check():
+async def health_check():
     """Health Check"""
 
-    return "Server is running!"
+    return HEALTH_OK
 
 
 app.include_router(router, tags=["orders"], prefix="/v1")
 
-oas_doc = yaml.safe_load((Path(__file__).parent / "oas.yaml").read_text())
+OAS_JSON = (Path(__file__).parent / "oas.json").read_bytes()
+
+
+@app.get("/openapi/orders.json", include_in_schema=False)
+async def openapi_doc():
+    """Returns the prebuilt OpenAPI document"""
+
+    return Response(content=OAS_JSON, media_type="application/json")
+
+
+@app.get("/docs/orders", include_in_schema=False)
+async def swagger_docs():
+    """Swagger UI backed by the prebuilt OpenAPI document"""
 
-app.openapi = lambda: oas_doc
+    return get_swagger_ui_html(openapi_url="/openapi/orders.json", title=f"{app.title} - Swagger UI")
@@ -5,7 +5,7 @@ Module that provides common classes for the Orders API
 from enum import Enum
 
 
-class Product(Enum):
+class Product(str, Enum):
     """Product Enum"""
 
     CHEESE = "cheese"
@@ -21,7 +21,7 @@ class Product(Enum):
     ICEDTEA = "icedtea"
 
 
-class Size(Enum):
+class Size(str, Enum):
     """Size Enum"""
 
     SMALL = "small"
@@ -30,7 +30,7 @@ class Size(Enum):
     XLARGE = "xlarge"
 
 
-class Status(Enum):
+class Status(str, Enum):
     """Status Enum"""
 
     CREATED = "created"
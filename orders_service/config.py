@@ -12,6 +12,14 @@ class Config(BaseSettings):
     """Envrionment Config"""
 
     DATABASE_URL: str
+    DEBUG: bool = False
+    REDIS_URL: str | None = None
+
+    # Size the pool so that DB_POOL_SIZE + DB_MAX_OVERFLOW times the number of
+    # workers stays below the database's max connections
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
 
     model_config = SettingsConfigDict(case_sensitive=True, env_file_encoding="utf-8")
 
@@ -32,5 +40,5 @@ class Config(BaseSettings):
 
 @lru_cache
 def get_config(filename: str):
-    """Gets Config"""
+    """Gets Config; each env file is read and parsed once per process"""
     return Config(_env_file=filename)
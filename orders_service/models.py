@@ -3,65 +3,52 @@ Module that provides models for the database
 """
 
 import datetime
+import uuid
 from uuid import uuid4
 
-from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import (
     Mapped,
     declarative_base,
     mapped_column,
     relationship,
-    validates,
 )
 
 from orders_service.common import Product, Size, Status
 
 
-def generate_uuid():
-    """Generates UUID as String"""
-
-    return str(uuid4())
-
-
 Base = declarative_base()
 
 
-class OrderModel(Base):
+class OrderModel(Base):  # pylint: disable=too-few-public-methods
     """Order Model"""
 
     __tablename__ = "order"
+    __table_args__ = (Index("ix_order_status_created", "status", "created"),)
 
-    id: Mapped[str] = mapped_column(default=generate_uuid, primary_key=True, index=True)
+    # ids stay client-generated: SQLite has no server-side UUID function, so a
+    # server_default (gen_random_uuid() on PostgreSQL) cannot be used here
+    id: Mapped[uuid.UUID] = mapped_column(default=uuid4, primary_key=True, index=True)
     created: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.now(datetime.UTC))
-    status: Mapped[Status] = mapped_column(default=Status.CREATED, nullable=False)
+    status: Mapped[Status] = mapped_column(String(16), default=Status.CREATED, nullable=False)
     items: Mapped[list["OrderItemModel"]] = relationship(
         "OrderItemModel", cascade="all,delete", backref="order", lazy="selectin"
     )
 
-    def dict(self):
-        """Returns Order Item as a dict"""
-
-        return {
-            "id": self.id,
-            "status": self.status,
-            "created": self.created,
-            "items": [item.dict() for item in self.items],
-        }
-
     def __repr__(self) -> str:
         """Order REPR"""
 
         return f"Order(id={self.id!r}, created={self.created!r}, status={self.status!r}, items={self.items!r})"
 
 
-class OrderItemModel(Base):
+class OrderItemModel(Base):  # pylint: disable=too-few-public-methods
     """Order Item Model"""
 
     __tablename__ = "order_item"
 
-    id: Mapped[str] = mapped_column(default=generate_uuid, primary_key=True, index=True)
-    product: Mapped[Product] = mapped_column(nullable=False)
-    size: Mapped[Size] = mapped_column(nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(default=uuid4, primary_key=True, index=True)
+    product: Mapped[Product] = mapped_column(String(16), nullable=False)
+    size: Mapped[Size] = mapped_column(String(16), nullable=False)
     quantity = Column(
         Integer,
         CheckConstraint("quantity >= 1 AND quantity <= 10"),
@@ -69,25 +56,7 @@ class OrderItemModel(Base):
         nullable=False,
     )
 
-    order_id: Mapped[str] = mapped_column(ForeignKey("order.id"), index=True, nullable=False)
-
-    @validates("quantity")
-    def validate_quantity(self, _, value):
-        """Quantity Validation"""
-
-        if value < 1 or value > 10:
-            raise ValueError(f"Quantity must be between 1 and 10 found: {value}")
-        return value
-
-    def dict(self):
-        """Returns Order Item as a dict"""
-
-        return {
-            "id": self.id,
-            "product": self.product,
-            "size": self.size,
-            "quantity": self.quantity,
-        }
+    order_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("order.id"), index=True, nullable=False)
 
     def __repr__(self) -> str:
         """Order Item REPR"""
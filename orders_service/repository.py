@@ -2,14 +2,16 @@
 Module that provides repository for the Orders API
 """
 
-from typing import Annotated, Optional
-from uuid import UUID
+import datetime
+from typing import Annotated, Optional, Sequence
+from uuid import UUID, uuid4
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from orders_service.exceptions import OrderEntityNotFoundError, OrderValidationError
 from orders_service.models import OrderItemModel, OrderModel, Status
 from orders_service.schemas import (
     OrderCreateSchema,
@@ -20,16 +22,24 @@ from orders_service.schemas import (
 from orders_service.session import DBSessionDep
 
 
+_FETCH_BY_ID = select(OrderModel).options(selectinload(OrderModel.items)).where(OrderModel.id == bindparam("oid"))
+
+
 class OrdersRepository:
     """Orders API Reponsitory"""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list(self, cancelled: Optional[bool] = None, limit: Optional[int] = None) -> OrdersListSchema:
-        """List Orders"""
+    async def _fetch(self, order_id: UUID) -> Optional[OrderModel]:
+        """Fetches an order by ID, returning None when it does not exist"""
+
+        return (await self.db.execute(_FETCH_BY_ID, {"oid": order_id})).scalars().first()
 
-        orders_to_get = select(OrderModel)
+    async def list_rows(self, cancelled: Optional[bool] = None, limit: Optional[int] = None) -> Sequence[OrderModel]:
+        """List Orders as ORM rows"""
+
+        orders_to_get = select(OrderModel).options(selectinload(OrderModel.items)).order_by(OrderModel.created.desc())
 
         if cancelled is not None:
             if cancelled:
@@ -37,102 +47,108 @@ class OrdersRepository:
             else:
                 orders_to_get = orders_to_get.where(OrderModel.status != Status.CANCELLED)
         if limit is not None:
-            if limit < 1 or limit > 10:
-                raise OrderValidationError(f"Limit must be >= 1 and <= 10: found {limit}")
-
             orders_to_get = orders_to_get.limit(limit)
 
-        orders_found = (await self.db.execute(orders_to_get)).scalars().all()
+        return (await self.db.execute(orders_to_get)).scalars().all()
+
+    async def list(self, cancelled: Optional[bool] = None, limit: Optional[int] = None) -> OrdersListSchema:
+        """List Orders"""
+
+        orders_found = await self.list_rows(cancelled, limit)
 
-        return OrdersListSchema(orders=[OrderGetSchema(**order.dict()) for order in orders_found])
+        return OrdersListSchema(orders=[OrderGetSchema.model_validate(order) for order in orders_found])
 
     async def create(self, order_details: OrderCreateSchema) -> OrderModel:
         """Create Order"""
 
-        order_created = OrderModel(items=[OrderItemModel(**item) for item in order_details.model_dump()["items"]])
+        return (await self.create_many([order_details]))[0]
 
-        self.db.add(order_created)
-        await self.db.commit()
-        await self.db.refresh(order_created)
+    async def create_many(self, orders_details: Sequence[OrderCreateSchema]) -> Sequence[OrderModel]:
+        """Create multiple Orders with one batched insert per table"""
 
-        return order_created
+        created = datetime.datetime.now(datetime.UTC)
+        order_rows = []
+        item_rows = []
+        orders = []
 
-    async def get(self, order_id: UUID) -> OrderModel:
-        """Get Order"""
+        for order_details in orders_details:
+            order_id = uuid4()
+            rows = [{**item, "id": uuid4(), "order_id": order_id} for item in order_details.model_dump()["items"]]
+            order_rows.append({"id": order_id, "created": created, "status": Status.CREATED})
+            item_rows.extend(rows)
+            orders.append(
+                OrderModel(
+                    id=order_id, created=created, status=Status.CREATED, items=[OrderItemModel(**row) for row in rows]
+                )
+            )
 
-        order_found = (
-            (await self.db.execute(select(OrderModel).where(OrderModel.id == str(order_id)))).scalars().first()
-        )
+        await self.db.execute(insert(OrderModel), order_rows)
+        await self.db.execute(insert(OrderItemModel), item_rows)
 
-        if not order_found:
-            raise OrderEntityNotFoundError(f"Order with ID {order_id} not found")
+        return orders
 
-        return order_found
+    async def get(self, order_id: UUID) -> Optional[OrderModel]:
+        """Get Order"""
 
-    async def update(self, order_id: UUID, order_details: OrderUpdateSchema) -> OrderModel:
+        return await self._fetch(order_id)
+
+    async def update(self, order_id: UUID, order_details: OrderUpdateSchema) -> Optional[OrderModel]:
         """Update Order"""
 
-        order_found = (
-            (await self.db.execute(select(OrderModel).where(OrderModel.id == str(order_id)))).scalars().first()
-        )
+        order_found = await self._fetch(order_id)
 
-        if not order_found:
-            raise OrderEntityNotFoundError(f"Order with ID {order_id} not found")
+        if order_found is None:
+            return None
 
-        for item in order_found.items:
-            await self.db.delete(item)
+        await self.db.execute(delete(OrderItemModel).where(OrderItemModel.order_id == order_id))
 
+        # The old items are already gone from the DB; reset the loaded collection
+        # so the unit of work only flushes the new items
+        set_committed_value(order_found, "items", [])
         order_found.items = [OrderItemModel(**item) for item in order_details.model_dump()["items"]]
 
-        await self.db.commit()
-        await self.db.refresh(order_found)
+        await self.db.flush()
 
         return order_found
 
-    async def delete(self, order_id: UUID) -> OrderModel:
-        """Get Order"""
+    async def delete(self, order_id: UUID) -> Optional[OrderModel]:
+        """Delete Order"""
 
-        order_found = (
-            (await self.db.execute(select(OrderModel).where(OrderModel.id == str(order_id)))).scalars().first()
-        )
+        order_found = await self._fetch(order_id)
 
-        if not order_found:
-            raise OrderEntityNotFoundError(f"Order with ID {order_id} not found")
+        if order_found is None:
+            return None
 
         await self.db.delete(order_found)
-        await self.db.commit()
+        await self.db.flush()
+
+        return order_found
 
-    async def cancel(self, order_id: UUID) -> OrderModel:
+    async def cancel(self, order_id: UUID) -> Optional[OrderModel]:
         """Cancel Order"""
 
-        order_found = (
-            (await self.db.execute(select(OrderModel).where(OrderModel.id == str(order_id)))).scalars().first()
-        )
+        order_found = await self._fetch(order_id)
 
-        if not order_found:
-            raise OrderEntityNotFoundError(f"Order with ID {order_id} not found")
+        if order_found is None:
+            return None
 
         order_found.status = Status.CANCELLED
 
-        await self.db.commit()
-        await self.db.refresh(order_found)
+        await self.db.flush()
 
         return order_found
 
-    async def pay(self, order_id: UUID) -> OrderModel:
+    async def pay(self, order_id: UUID) -> Optional[OrderModel]:
         """Pay Order"""
 
-        order_found = (
-            (await self.db.execute(select(OrderModel).where(OrderModel.id == str(order_id)))).scalars().first()
-        )
+        order_found = await self._fetch(order_id)
 
-        if not order_found:
-            raise OrderEntityNotFoundError(f"Order with ID {order_id} not found")
+        if order_found is None:
+            return None
 
         order_found.status = Status.PAID
 
-        await self.db.commit()
-        await self.db.refresh(order_found)
+        await self.db.flush()
 
         return order_found
 
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Annotated, List, Optional
 from uuid import UUID
 
+import msgspec
 from annotated_types import MinLen
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -13,7 +14,7 @@ from orders_service.common import Product, Size, Status
 class OrderItemGetSchema(BaseModel):
     """Order Item Schema"""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
 
     id: Optional[UUID] = None
     product: Product
@@ -32,7 +33,7 @@ class OrderItemGetSchema(BaseModel):
 class OrderGetSchema(BaseModel):
     """Order Get Schema"""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
 
     id: Optional[UUID] = None
     created: datetime
@@ -46,6 +47,44 @@ class OrdersListSchema(BaseModel):
     orders: List[OrderGetSchema]
 
 
+class OrderItemGetStruct(msgspec.Struct):  # pylint: disable=too-few-public-methods
+    """Order Item Get Struct"""
+
+    id: UUID
+    product: Product
+    size: Size
+    quantity: int
+
+
+class OrderGetStruct(msgspec.Struct):  # pylint: disable=too-few-public-methods
+    """Order Get Struct"""
+
+    id: UUID
+    created: datetime
+    status: Status
+    items: List[OrderItemGetStruct]
+
+
+class OrdersListStruct(msgspec.Struct):  # pylint: disable=too-few-public-methods
+    """Orders List Struct"""
+
+    orders: List[OrderGetStruct]
+
+
+def order_to_struct(order) -> OrderGetStruct:
+    """Builds an OrderGetStruct from an order's attributes"""
+
+    return OrderGetStruct(
+        id=order.id,
+        created=order.created,
+        status=order.status,
+        items=[
+            OrderItemGetStruct(id=item.id, product=item.product, size=item.size, quantity=item.quantity)
+            for item in order.items
+        ],
+    )
+
+
 class OrderCreateSchema(BaseModel):
     """Order Create Schema"""
 
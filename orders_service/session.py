@@ -6,6 +6,7 @@ import contextlib
 from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
@@ -15,31 +16,76 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from sqlalchemy.orm import Session, raiseload
+
 from orders_service.exceptions import OrdersApiError, OrderServiceError
 from orders_service.models import Base
 
 
-class SessionManager:
-    """Order API Session Manager"""
+def _raise_on_lazy_load(execute_state):
+    """Turns any accidental lazy relationship load into a loud failure"""
 
-    engine: AsyncEngine | None
-    sessionmaker: async_sessionmaker[AsyncSession] | None
+    if execute_state.is_select and not execute_state.is_relationship_load:
+        execute_state.statement = execute_state.statement.options(raiseload("*"))
 
-    def initialize(self, db_url: str):
-        """Initialize Session"""
 
-        self.engine = create_async_engine(db_url)
-        self.sessionmaker = async_sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+class SessionManager:
+    """Order API Session Manager"""
 
-    async def end(self):
-        """Ends Session"""
+    engine: AsyncEngine | None = None
+    sessionmaker: async_sessionmaker[AsyncSession] | None = None
+    db_url: str | None = None
+
+    def initialize(
+        self,
+        db_url: str,
+        debug: bool = False,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+    ):
+        """Initialize Session; re-initializing with the same URL is a no-op"""
+
+        if self.engine is not None and self.db_url == db_url:
+            return
+
+        engine_kwargs = {"pool_pre_ping": True, "pool_recycle": pool_recycle}
+
+        # SQLite engines use NullPool/StaticPool, which reject queue-pool sizing,
+        # and the connect_args below are asyncpg-only: a larger prepared-statement
+        # cache keeps hot query plans parsed, and PG JIT only hurts short OLTP queries
+        if db_url.startswith("postgresql"):
+            engine_kwargs.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                connect_args={
+                    "prepared_statement_cache_size": 512,
+                    "server_settings": {"jit": "off", "application_name": "orders_service"},
+                },
+            )
+
+        self.db_url = db_url
+        self.engine = create_async_engine(db_url, **engine_kwargs)
+        self.sessionmaker = async_sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
+
+        if debug and not event.contains(Session, "do_orm_execute", _raise_on_lazy_load):
+            event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+
+    async def end(self, force: bool = False):
+        """Ends Session; a no-op unless force is set, so shared engines survive"""
         if self.engine is None:
             raise OrderServiceError
 
+        if not force:
+            return
+
         await self.engine.dispose()
 
         self.engine = None
         self.sessionmaker = None
+        self.db_url = None
 
     @contextlib.asynccontextmanager
     async def begin(self) -> AsyncIterator[AsyncConnection]:
@@ -80,9 +126,15 @@ class SessionManager:
 __session_manager: SessionManager = SessionManager()
 
 
-def init_session_manager(db_url: str):
+def init_session_manager(
+    db_url: str,
+    debug: bool = False,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+    pool_recycle: int = 1800,
+):
     """Initialize Session Manager"""
-    __session_manager.initialize(db_url)
+    __session_manager.initialize(db_url, debug, pool_size, max_overflow, pool_recycle)
 
 
 async def begin_session_create_tables():
@@ -91,16 +143,17 @@ async def begin_session_create_tables():
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def end_session():
-    """Ends Session"""
-    await __session_manager.end()
+async def end_session(force: bool = False):
+    """Ends Session; pass force=True to actually dispose the engine"""
+    await __session_manager.end(force)
 
 
 async def get_db_session() -> AsyncIterator[AsyncSession]:
-    """Gets Session"""
+    """Gets Session wrapped in a single per-request transaction"""
 
     async with __session_manager.session() as session:
-        yield session
+        async with session.begin():
+            yield session
 
 
 DBSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
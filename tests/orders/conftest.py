@@ -0,0 +1,164 @@
+"""
+Fixtures for the Orders API tests
+
+Schema DDL runs once per session; each test is wrapped in a
+connection-level transaction that is rolled back on teardown, so no
+per-test table cleanup is needed
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fastapi_cache import FastAPICache
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from orders_service.app import app
+from orders_service.models import Base
+from orders_service.repository import OrdersRepository
+from orders_service.schemas import OrderCreateSchema
+from orders_service.session import get_db_session
+
+
+@pytest.fixture(scope="session")
+def database_url():
+    """URL of the test database"""
+
+    return "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture(scope="session")
+def db_engine(database_url: str):
+    """Creates the test engine once for the whole session"""
+
+    # A StaticPool keeps the single connection that holds the in-memory DB
+    # alive for the whole run; each xdist worker process gets its own database.
+    # A sized queue pool would hand out extra connections that each see an
+    # empty database, so it only fits if the tests move to a server-backed DB
+    engine = create_async_engine(database_url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+    # pysqlite's legacy transaction handling never opens the outer BEGIN, which
+    # lets released savepoints autocommit; emit BEGIN ourselves instead
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_manual_transactions(dbapi_connection, _):  # pylint: disable=unused-variable
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _sqlite_emit_begin(conn):  # pylint: disable=unused-variable
+        conn.exec_driver_sql("BEGIN")
+
+    yield engine
+
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def database_schema(db_engine):
+    """Creates the test schema once for the whole session"""
+
+    async def _recreate():
+        async with db_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_recreate())
+
+
+@pytest_asyncio.fixture
+async def db_connection(db_engine, database_schema):
+    """Yields a connection inside a transaction that is rolled back after the test"""
+
+    connection = await db_engine.connect()
+    await connection.begin()
+
+    yield connection
+
+    await connection.rollback()
+    await connection.close()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_connection):
+    """Yields a session that writes into the test transaction through savepoints"""
+
+    session = AsyncSession(bind=db_connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+
+    yield session
+
+    await session.close()
+
+
+@pytest_asyncio.fixture
+async def orders_repo(db_session: AsyncSession):
+    """Orders repository bound to the rollback-isolated session"""
+
+    yield OrdersRepository(db_session)
+
+
+DEFAULT_ORDER = OrderCreateSchema(items=[{"product": "cheese", "size": "small"}])
+
+
+@pytest_asyncio.fixture
+async def make_order(orders_repo: OrdersRepository):
+    """Factory that seeds one order directly through the repository"""
+
+    async def _make(items=None):
+        return await orders_repo.create(DEFAULT_ORDER if items is None else OrderCreateSchema(items=items))
+
+    yield _make
+
+
+@pytest_asyncio.fixture
+async def seed_orders(orders_repo: OrdersRepository):
+    """Seeds orders through the repository in one batch instead of per-order API calls"""
+
+    async def _seed(items_lists):
+        return await orders_repo.create_many([OrderCreateSchema(items=items) for items in items_lists])
+
+    yield _seed
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client():
+    """One shared in-process HTTP client for the whole session"""
+
+    # ASGITransport never runs the app lifespan, so the production session
+    # manager stays untouched
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver/v1/orders") as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def validation_client(http_client: AsyncClient):
+    """HTTP client for request-validation tests; requests never reach the database"""
+
+    async def override_db_session():
+        yield None
+
+    app.dependency_overrides[get_db_session] = override_db_session
+
+    yield http_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def orders_client(http_client: AsyncClient, db_connection):
+    """HTTP client running the app in-process on the rollback-isolated connection"""
+
+    # Requests must not overlap: interleaved savepoints from concurrent
+    # sessions on the one shared SQLite connection release out of order
+    async def override_db_session():
+        session = AsyncSession(bind=db_connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        async with session, session.begin():
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_db_session
+    await FastAPICache.clear(namespace="orders")
+
+    yield http_client
+
+    app.dependency_overrides.clear()
@@ -1,48 +1,44 @@
-from contextlib import asynccontextmanager
+from functools import lru_cache
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 from pydantic import ValidationError
 
 from orders_service.common import Product, Size, Status
-from orders_service.config import get_config
-from orders_service.exceptions import OrderEntityNotFoundError, OrderValidationError
 from orders_service.repository import OrdersRepository
 from orders_service.schemas import OrderCreateSchema
-from orders_service.session import begin_session_create_tables, end_session, get_db_session, init_session_manager
+
+CHEESE_SMALL = OrderCreateSchema(items=[{"product": "cheese", "size": "small"}])
+PEPPERONI_MEDIUM = OrderCreateSchema(items=[{"product": "pepperoni", "size": "medium"}])
+COKE_LARGE = OrderCreateSchema(items=[{"product": "coke", "size": "large"}])
+GINGERALE_XLARGE = OrderCreateSchema(items=[{"product": "gingerale", "size": "xlarge"}])
+HAWAIIAN_XLARGE = OrderCreateSchema(items=[{"product": "hawaiian", "size": "xlarge"}])
+SPRITE_XLARGE = OrderCreateSchema(items=[{"product": "sprite", "size": "xlarge"}])
+
+
+@lru_cache(maxsize=None)
+def schema(product: Product, size: Size, quantity: int = 1) -> OrderCreateSchema:
+    """Returns the one OrderCreateSchema instance for a product/size/quantity shape"""
+
+    return OrderCreateSchema(items=[{"product": product, "size": size, "quantity": quantity}])
 
 
 class TestOrdersRepository:
     """Test Orders Repository"""
 
-    @pytest_asyncio.fixture
-    async def orders_repo(self):
-        init_session_manager(get_config("orders_service/.env.test").DATABASE_URL)
-        await begin_session_create_tables()
-        async with asynccontextmanager(get_db_session)() as session:
-            yield OrdersRepository(session)
-        await end_session()
-
     # Orders List Happy Path
 
-    @pytest.mark.asyncio
     async def test_that_list_orders_should_be_empty(self, orders_repo: OrdersRepository):
         response = await orders_repo.list()
 
         assert len(response.orders) == 0
 
-    @pytest.mark.asyncio
     async def test_that_list_orders_should_retrieve_4_orders(self, orders_repo: OrdersRepository):
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "pepperoni", "size": "medium"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "coke", "size": "large"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "gingerale", "size": "xlarge"}]))
+        await orders_repo.create_many([CHEESE_SMALL, PEPPERONI_MEDIUM, COKE_LARGE, GINGERALE_XLARGE])
 
         response = await orders_repo.list()
         assert len(response.orders) == 4
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize("cancelled,count", [(True, 1), (False, 3)])
     async def test_that_list_orders_should_retrieve_filtered_orders(
         self,
@@ -50,11 +46,8 @@ class TestOrdersRepository:
         cancelled: bool,
         count: int,
     ):
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "pepperoni", "size": "medium"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "coke", "size": "large"}]))
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "gingerale", "size": "xlarge"}]))
-        order_id = response.id
+        orders = await orders_repo.create_many([CHEESE_SMALL, PEPPERONI_MEDIUM, COKE_LARGE, GINGERALE_XLARGE])
+        order_id = orders[-1].id
 
         await orders_repo.cancel(order_id)
 
@@ -62,7 +55,6 @@ class TestOrdersRepository:
 
         assert len(response.orders) == count
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize("limit,expected_limit", [(1, 1), (5, 5), (10, 5)])
     async def test_that_list_orders_should_retrieve_limited_orders(
         self,
@@ -70,44 +62,25 @@ class TestOrdersRepository:
         limit: int,
         expected_limit: int,
     ):
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "pepperoni", "size": "medium"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "hawaiian", "size": "xlarge"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "coke", "size": "large"}]))
-        await orders_repo.create(OrderCreateSchema(items=[{"product": "gingerale", "size": "xlarge"}]))
+        await orders_repo.create_many([CHEESE_SMALL, PEPPERONI_MEDIUM, HAWAIIAN_XLARGE, COKE_LARGE, GINGERALE_XLARGE])
 
         response = await orders_repo.list(None, limit)
 
         assert len(response.orders) == expected_limit
 
-    # Orders List Sad Path
-
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("limit", [0, 11])
-    async def test_that_list_orders_should_fail_to_retrieve_limited_orders_out_of_range(
-        self, orders_repo: OrdersRepository, limit: int
-    ):
-        with pytest.raises(OrderValidationError) as e:
-            await orders_repo.list(None, limit)
-
-        assert e.value.message == f"Limit must be >= 1 and <= 10: found {limit}"
-
     # Orders Create Happy Path
 
-    @pytest.mark.asyncio
     async def test_that_an_order_is_created_with_default_quantity(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+        response = await orders_repo.create(CHEESE_SMALL)
 
         assert response.id is not None
         assert response.created is not None
         assert response.status == Status.CREATED
-        assert len(response.items) == 1
-        assert response.items[0].id is not None
-        assert response.items[0].product == Product.CHEESE
-        assert response.items[0].size == Size.SMALL
-        assert response.items[0].quantity == 1
+        assert all(item.id is not None for item in response.items)
+        assert [(item.product, item.size, item.quantity) for item in response.items] == [
+            (Product.CHEESE, Size.SMALL, 1)
+        ]
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "product,size,quantity",
         [(Product.COKE, Size.LARGE, 4), (Product.ICEDTEA, Size.MEDIUM, 10)],
@@ -119,22 +92,16 @@ class TestOrdersRepository:
         size: Size,
         quantity: int,
     ):
-        response = await orders_repo.create(
-            OrderCreateSchema(items=[{"product": product, "size": size, "quantity": quantity}])
-        )
+        response = await orders_repo.create(schema(product, size, quantity))
 
         assert response.id is not None
         assert response.created is not None
         assert response.status == Status.CREATED
-        assert len(response.items) == 1
-        assert response.items[0].id is not None
-        assert response.items[0].product == product
-        assert response.items[0].size == size
-        assert response.items[0].quantity == quantity
+        assert all(item.id is not None for item in response.items)
+        assert [(item.product, item.size, item.quantity) for item in response.items] == [(product, size, quantity)]
 
     # Orders Create Sad Path
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "quantity,msg",
         [(0, "Input should be greater than or equal to 1"), (11, "Input should be less than or equal to 10")],
@@ -152,7 +119,6 @@ class TestOrdersRepository:
 
         assert e.value.errors()[0]["msg"] == msg
 
-    @pytest.mark.asyncio
     async def test_that_an_order_should_fail_to_create_with_incorrect_product(self, orders_repo: OrdersRepository):
         msg = "Input should be 'cheese', 'pepperoni', 'deluxe', 'hawaiian', 'canadian', 'veggie', 'coke', 'sprite', 'gingerale' or 'icedtea'"
         with pytest.raises(ValidationError) as e:
@@ -160,7 +126,6 @@ class TestOrdersRepository:
 
         assert e.value.errors()[0]["msg"] == msg
 
-    @pytest.mark.asyncio
     async def test_that_an_order_should_fail_to_create_with_quantity_incorrect_size(
         self, orders_repo: OrdersRepository
     ):
@@ -169,7 +134,6 @@ class TestOrdersRepository:
 
         assert e.value.errors()[0]["msg"] == "Input should be 'small', 'medium', 'large' or 'xlarge'"
 
-    @pytest.mark.asyncio
     async def test_that_an_order_should_fail_to_create_with_no_items(self, orders_repo: OrdersRepository):
         with pytest.raises(ValidationError) as e:
             await orders_repo.create(OrderCreateSchema(items=[]))
@@ -178,12 +142,11 @@ class TestOrdersRepository:
 
     # Orders Get Happy Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_is_retrieved_by_id(self, orders_repo: OrdersRepository):
+    async def test_that_an_order_is_retrieved_by_id(self, orders_repo: OrdersRepository, make_order):
         quantity = 5
         items = [{"product": "cheese", "size": "small"}, {"product": "sprite", "size": "xlarge", "quantity": quantity}]
 
-        response = await orders_repo.create(OrderCreateSchema(items=items))
+        response = await make_order(items)
         order_id = response.id
 
         response = await orders_repo.get(order_id)
@@ -191,62 +154,51 @@ class TestOrdersRepository:
         assert response.id == order_id
         assert response.created is not None
         assert response.status == Status.CREATED
-        assert len(response.items) == 2
-        assert response.items[0].id is not None
-        assert response.items[0].product == Product.CHEESE
-        assert response.items[0].size == Size.SMALL
-        assert response.items[0].quantity == 1
-        assert response.items[1].id is not None
-        assert response.items[1].product == Product.SPRITE
-        assert response.items[1].size == Size.XLARGE
-        assert response.items[1].quantity == quantity
+        assert all(item.id is not None for item in response.items)
+        assert [(item.product, item.size, item.quantity) for item in response.items] == [
+            (Product.CHEESE, Size.SMALL, 1),
+            (Product.SPRITE, Size.XLARGE, quantity),
+        ]
 
     # Orders Get Sad Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_fails_to_retrieved_by_id_with_incorrect_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+    async def test_that_an_order_fails_to_retrieved_by_id_with_incorrect_id(
+        self, orders_repo: OrdersRepository, make_order
+    ):
+        response = await make_order()
         order_id = response.id
 
         fake_order_id = uuid4()
 
-        with pytest.raises(OrderEntityNotFoundError) as e:
-            await orders_repo.get(fake_order_id)
-
-        assert e.value.message == f"Order with ID {fake_order_id} not found"
+        assert await orders_repo.get(fake_order_id) is None
         assert order_id != fake_order_id
 
     # Orders Update Happy Path
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "product,size,quantity",
         [(Product.GINGERALE, Size.LARGE, 6), (Product.HAWAIIAN, Size.XLARGE, 2)],
     )
     async def test_that_an_order_is_updated_by_id_with_product_size_and_quantity(
-        self, orders_repo: OrdersRepository, product: Product, size: Size, quantity: int
+        self, orders_repo: OrdersRepository, product: Product, size: Size, quantity: int, make_order
     ):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+        response = await make_order()
         order_id = response.id
 
-        response = await orders_repo.update(
-            order_id, OrderCreateSchema(items=[{"product": product, "size": size, "quantity": quantity}])
-        )
+        response = await orders_repo.update(order_id, schema(product, size, quantity))
 
         assert response.id == order_id
         assert response.created is not None
         assert response.status == Status.CREATED
-        assert len(response.items) == 1
-        assert response.items[0].id is not None
-        assert response.items[0].product == product
-        assert response.items[0].size == size
-        assert response.items[0].quantity == quantity
+        assert all(item.id is not None for item in response.items)
+        assert [(item.product, item.size, item.quantity) for item in response.items] == [(product, size, quantity)]
 
     # Orders Update Sad Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_should_fail_to_update_by_id_with_no_items(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+    async def test_that_an_order_should_fail_to_update_by_id_with_no_items(
+        self, orders_repo: OrdersRepository, make_order
+    ):
+        response = await make_order()
         order_id = response.id
 
         with pytest.raises(ValidationError) as e:
@@ -254,52 +206,43 @@ class TestOrdersRepository:
 
         assert e.value.errors()[0]["msg"] == "List should have at least 1 item after validation, not 0"
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_fails_to_update_by_id_with_incorrect_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "sprite", "size": "xlarge"}]))
+    async def test_that_an_order_fails_to_update_by_id_with_incorrect_id(
+        self, orders_repo: OrdersRepository, make_order
+    ):
+        response = await make_order([{"product": "sprite", "size": "xlarge"}])
         order_id = response.id
         fake_order_id = uuid4()
 
-        with pytest.raises(OrderEntityNotFoundError) as e:
-            await orders_repo.update(fake_order_id, OrderCreateSchema(items=[{"product": "sprite", "size": "xlarge"}]))
-
-        assert e.value.message == f"Order with ID {fake_order_id} not found"
+        assert await orders_repo.update(fake_order_id, SPRITE_XLARGE) is None
         assert order_id != fake_order_id
 
     # Orders Delete Happy Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_is_deleted_by_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+    async def test_that_an_order_is_deleted_by_id(self, orders_repo: OrdersRepository, make_order):
+        response = await make_order()
         order_id = response.id
 
         await orders_repo.delete(order_id)
 
-        with pytest.raises(OrderEntityNotFoundError) as e:
-            await orders_repo.get(order_id)
-
-        assert e.value.message == f"Order with ID {order_id} not found"
+        assert await orders_repo.get(order_id) is None
 
     # Orders Delete Sad Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_fails_to_delete_by_id_with_incorrect_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "sprite", "size": "xlarge"}]))
+    async def test_that_an_order_fails_to_delete_by_id_with_incorrect_id(
+        self, orders_repo: OrdersRepository, make_order
+    ):
+        response = await make_order([{"product": "sprite", "size": "xlarge"}])
         order_id = response.id
 
         fake_order_id = uuid4()
 
-        with pytest.raises(OrderEntityNotFoundError) as e:
-            await orders_repo.delete(fake_order_id)
-
-        assert e.value.message == f"Order with ID {fake_order_id} not found"
+        assert await orders_repo.delete(fake_order_id) is None
         assert order_id != fake_order_id
 
     # Orders Cancel Happy Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_is_canceled_by_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+    async def test_that_an_order_is_canceled_by_id(self, orders_repo: OrdersRepository, make_order):
+        response = await make_order()
         order_id = response.id
 
         assert response.status == Status.CREATED
@@ -311,24 +254,21 @@ class TestOrdersRepository:
 
     # Orders Cancel Sad Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_fails_to_cancel_by_id_with_incorrect_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "sprite", "size": "xlarge"}]))
+    async def test_that_an_order_fails_to_cancel_by_id_with_incorrect_id(
+        self, orders_repo: OrdersRepository, make_order
+    ):
+        response = await make_order([{"product": "sprite", "size": "xlarge"}])
         order_id = response.id
 
         fake_order_id = uuid4()
 
-        with pytest.raises(OrderEntityNotFoundError) as e:
-            await orders_repo.cancel(fake_order_id)
-
-        assert e.value.message == f"Order with ID {fake_order_id} not found"
+        assert await orders_repo.cancel(fake_order_id) is None
         assert order_id != fake_order_id
 
     # Orders Pay Happy Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_is_paid_by_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "cheese", "size": "small"}]))
+    async def test_that_an_order_is_paid_by_id(self, orders_repo: OrdersRepository, make_order):
+        response = await make_order()
         order_id = response.id
 
         assert response.status == Status.CREATED
@@ -340,15 +280,11 @@ class TestOrdersRepository:
 
     # Orders Pay Sad Path
 
-    @pytest.mark.asyncio
-    async def test_that_an_order_fails_to_pay_by_id_with_incorrect_id(self, orders_repo: OrdersRepository):
-        response = await orders_repo.create(OrderCreateSchema(items=[{"product": "sprite", "size": "xlarge"}]))
+    async def test_that_an_order_fails_to_pay_by_id_with_incorrect_id(self, orders_repo: OrdersRepository, make_order):
+        response = await make_order([{"product": "sprite", "size": "xlarge"}])
         order_id = response.id
 
         fake_order_id = uuid4()
 
-        with pytest.raises(OrderEntityNotFoundError) as e:
-            await orders_repo.pay(fake_order_id)
-
-        assert e.value.message == f"Order with ID {fake_order_id} not found"
+        assert await orders_repo.pay(fake_order_id) is None
         assert order_id != fake_order_id